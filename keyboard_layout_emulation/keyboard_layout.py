@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Set, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Tuple, Optional
 
 
 __all__ = [
@@ -230,6 +232,10 @@ def char_to_event_type_or_none(char: str) -> str:
     return char_to_keymap_type_dict.get(char, None)
 
 
+# Shared empty frozenset, since CPython allocates a new one for each `frozenset()`
+_EMPTY_FROZENSET: FrozenSet[str] = frozenset()
+
+
 class LayoutTranslation:
     """
     Represents the translation between a keyboard layout and QWERTY.
@@ -257,7 +263,11 @@ class LayoutTranslation:
                     conflicting_keys.add(i)
         self._in_out_dict = in_out
         self._out_in_dict = out_in
-        self._conflicting_keys = conflicting_keys
+        # Valid layouts, the common case, share the empty set
+        self._conflicting_keys = frozenset(conflicting_keys) if conflicting_keys else _EMPTY_FROZENSET
+        # Precomputed for constant-time membership checks against every keymap item
+        self._remapped_input_characters = frozenset(in_out)
+        self._remapped_output_characters = frozenset(out_in)
 
     @classmethod
     def identity(cls) -> LayoutTranslation:
@@ -303,7 +313,10 @@ class LayoutTranslation:
             })
         return LayoutTranslation(in_out, out_in)
 
+    # Caching is only safe because `LayoutTranslation` instances are immutable (they're compared
+    # by identity), and the same few pairs are requested repeatedly while polling the UI
     @classmethod
+    @lru_cache(maxsize=8)
     def from_input_to_target(cls, input_translation, target_translation):
         return cls.compose(input_translation, cls.inverse(target_translation))
 
@@ -314,6 +327,7 @@ class LayoutTranslation:
     colemak: LayoutTranslation
 
     built_in: Dict[str, LayoutTranslation]
+    built_in_names: FrozenSet[str]
     built_in_enum_items: Tuple[Optional[Tuple[str, str, str]], ...]
 
     @property
@@ -322,14 +336,18 @@ class LayoutTranslation:
     @property
     def out_in_dict(self) -> Dict[str, str]:
         return dict(self._out_in_dict)
+    @property
+    def in_out_mapping(self) -> Mapping[str, str]:
+        """Read-only view of `in_out_dict`, without copying it. Keys that aren't remapped are missing."""
+        return MappingProxyType(self._in_out_dict)
 
     @property
-    def remapped_input_characters(self) -> Set[str]:
-        return set(self._in_out_dict.keys())
+    def remapped_input_characters(self) -> FrozenSet[str]:
+        return self._remapped_input_characters
 
     @property
-    def remapped_output_characters(self) -> Set[str]:
-        return set(self._out_in_dict.keys())
+    def remapped_output_characters(self) -> FrozenSet[str]:
+        return self._remapped_output_characters
 
     def map_input_to_output(self, key: str) -> str:
         return self._in_out_dict.get(key, key)
@@ -341,7 +359,7 @@ class LayoutTranslation:
     def map_output_type_to_input_type(self, event_type: str) -> str:
         return char_to_event_type(self.map_output_to_input(event_type_to_char(event_type)))
 
-    def conflicting_keys(self) -> Set[str]:
+    def conflicting_keys(self) -> FrozenSet[str]:
         return self._conflicting_keys
     def is_valid(self):
         return not self._conflicting_keys
@@ -398,6 +416,7 @@ LayoutTranslation.built_in = {
     'Dvorak': LayoutTranslation.dvorak,
     'Colemak': LayoutTranslation.colemak,
 }
+LayoutTranslation.built_in_names = frozenset(LayoutTranslation.built_in)
 # It is important to ensure that strings returned by enum providers are kept referenced in Python.
 # See https://docs.blender.org/api/5.0/bpy.props.html#bpy.props.EnumProperty
 LayoutTranslation.built_in_enum_items = (
@@ -411,4 +430,4 @@ LayoutTranslation.built_in_enum_items = (
 )
 
 def is_built_in_layout(layout_name: str) -> bool:
-    return layout_name in LayoutTranslation.built_in
+    return layout_name in LayoutTranslation.built_in_names
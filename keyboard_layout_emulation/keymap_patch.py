@@ -3,7 +3,7 @@ import logging
 import bpy
 
 from .keyboard_layout import LayoutTranslation, event_type_to_char, char_to_event_type
-from .preferences import kle_prefs, keymap_id, KmiFingerprint, KmiAssignmentDiff
+from .preferences import kle_prefs, keymap_id, KmiFingerprint, KmiAssignmentDiff, freeze_map
 
 
 def reapply_keymap_translation(translation: LayoutTranslation, context=...):
@@ -18,7 +18,8 @@ def reapply_keymap_translation(translation: LayoutTranslation, context=...):
             logger.warning(msg)
         return False, msg
 
-    remapped = prefs.remapped_keys
+    # Copied, since it's read-only when empty
+    remapped = dict(prefs.remapped_keys)
     remaps = []
     for km, kmi, fingerprint, diff in prefs.pending_keymaps_to_emulate():
         original_type = kmi.type
@@ -60,18 +61,6 @@ def reapply_keymap_translation(translation: LayoutTranslation, context=...):
         return False, msg
 
 
-def freeze_map(d):
-    if isinstance(d, (set, frozenset)):
-        return frozenset(map(freeze_map, d))
-    elif isinstance(d, dict):
-        return frozenset([(k, freeze_map(v)) for k, v in d.items()])
-    elif isinstance(d, (list, tuple)):
-        return tuple(map(freeze_map, d))
-    elif hasattr(d.__class__, 'encode_json'):
-        d = freeze_map(d.__class__.encode_json(d))
-    return d
-
-
 def revert_keymap_translation(context=...):
     if context is ...:
         context = bpy.context
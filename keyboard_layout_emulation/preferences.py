@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import logging
+from operator import attrgetter
+import sys
+from types import MappingProxyType
 
 import bpy
 
-from typing import Any, Optional, List, Tuple, Dict, TYPE_CHECKING, Literal, TypeAlias, Iterator, Callable
+from typing import Any, Optional, List, Tuple, Dict, TYPE_CHECKING, Literal, TypeAlias, Iterator, Callable, Mapping, FrozenSet
 import json
 
+try:
+    # Optional faster JSON backend, used when available in Blender's Python environment
+    import orjson
+except ImportError:
+    orjson = None
+
 # noinspection PyUnresolvedReferences
 from bpy.types import AddonPreferences, OperatorProperties, PropertyGroup, KeyConfig
 from bpy.props import EnumProperty, StringProperty, BoolProperty, FloatProperty, PointerProperty
@@ -64,20 +74,48 @@ KeyConfig: TypeAlias = bpy.types.KeyConfig
 
 keyed_operator_properties = {'name', 'data_path'}
 
-_json_cache: Dict[str, Tuple[str, Any]] = {}
+_shared_json_decode = json.JSONDecoder().decode
+def _json_loads(s: str, **kwargs) -> Any:
+    if kwargs:
+        return json.loads(s, **kwargs)
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass  # Let `json` handle (or report) non-standard JSON
+    return _shared_json_decode(s)
+
+def _json_dumps(o: Any, *, ensure_ascii=False, **kwargs) -> str:
+    # orjson always writes UTF-8 without escaping, and does not support formatting options
+    if orjson is not None and not ensure_ascii and not kwargs:
+        try:
+            return orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # Let `json` handle (or report) unsupported values
+    return json.dumps(o, ensure_ascii=ensure_ascii, **kwargs)
+
+
+_json_cache: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+_JSON_CACHE_MAX_SIZE = 32
 def json_cached_loads(cache_key: str, s: str, *, decoder: Optional[Callable[[Any], Any]]=None, decode=True, **kwargs) -> Any:
     """
     Deserialize cached JSON string with optional support for list-encoded sets.
+
+    At most `_JSON_CACHE_MAX_SIZE` cache keys are kept, evicting the least recently used first.
     """
-    if cache_key in _json_cache:
-        cache_string, cache_value = _json_cache[cache_key]
+    cached = _json_cache.get(cache_key)
+    if cached is not None:
+        cache_string, cache_value = cached
         if cache_string == s:
+            _json_cache.move_to_end(cache_key)
             return cache_value
         if not s == '':
             del _json_cache[cache_key]
-    new_value = json_decode_loads(s, decoder=decoder, **kwargs) if decode else json.loads(s, **kwargs)
+    new_value = json_decode_loads(s, decoder=decoder, **kwargs) if decode else _json_loads(s, **kwargs)
     if s:
         _json_cache[cache_key] = (s, new_value)
+        if len(_json_cache) > _JSON_CACHE_MAX_SIZE:
+            _json_cache.popitem(last=False)
     return new_value
 
 
@@ -90,9 +128,13 @@ def json_decode_loads(s: str, *, decoder: Optional[Callable[[Any], Any]]=None, *
     it is not possible to change the way a JSONEncoder encodes lists deep within
     an object without fully reimplementing it
     """
+    # The decoded object is freshly allocated, so it can be patched in place,
+    # only descending into nested containers
     def patch(o):
         if isinstance(o, list):
-            o = [patch(oo) for oo in o]
+            for i, oo in enumerate(o):
+                if isinstance(oo, (list, dict)):
+                    o[i] = patch(oo)
             if len(o) > 1:
                 head = o[0]
                 if isinstance(head, str):
@@ -101,26 +143,34 @@ def json_decode_loads(s: str, *, decoder: Optional[Callable[[Any], Any]]=None, *
                     elif head.startswith('¦¦'):
                         o[0] = head[1:]
         elif isinstance(o, dict):
-            o = {k: patch(v) for k, v in o.items()}
+            for k, v in o.items():
+                if isinstance(v, (list, dict)):
+                    o[k] = patch(v)
         return o
-    decoded = patch(json.loads(s, **kwargs))
+    decoded = patch(_json_loads(s, **kwargs))
     if decoder is not None:
         decoded = decoder(decoded)
     return decoded
 
+_JSON_ENCODE_PATCHED_TYPES = (set, list, tuple, dict)
 def json_encode_dumps(o: Any, *, encoder: Optional[Callable[[Any], Any]]=None, ensure_ascii=False, sorted_sets=False, **kwargs) -> str:
     """
     Serialize JSON string with support for list-encoded sets,
     applying an optional encoder.
     """
+    def patch_items(items) -> list:
+        # Containers of scalars (the usual case) are copied without patching each element
+        if any(isinstance(ooo, _JSON_ENCODE_PATCHED_TYPES) for ooo in items):
+            return [patch(ooo) for ooo in items]
+        return list(items)
     def patch(oo):
         if isinstance(oo, set):
-            ol = [patch(oo) for oo in oo]
+            ol = patch_items(oo)
             if sorted_sets:
                 ol.sort()
             oo = ['¦set'] + ol
         elif isinstance(oo, (list, tuple)):
-            oo = [patch(oo) for oo in oo]
+            oo = patch_items(oo)
             if len(oo) > 0:
                 head = oo[0]
                 if isinstance(head, str) and head.startswith('¦'):
@@ -130,7 +180,7 @@ def json_encode_dumps(o: Any, *, encoder: Optional[Callable[[Any], Any]]=None, e
         return oo
     if encoder is not None:
         o = encoder(o)
-    return json.dumps(patch(o), ensure_ascii=ensure_ascii, **kwargs)
+    return _json_dumps(patch(o), ensure_ascii=ensure_ascii, **kwargs)
 
 def kle_prefs(context=...) -> KLEPreferences:
     """Return this add-on's preferences instance from bpy.context."""
@@ -147,31 +197,44 @@ def kle_logger(context=...) -> Optional[logging.Logger]:
 class KLEPreferencesUnavailableException(Exception):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class KeyConfigSet:
     active: KeyConfig
     user: KeyConfig
     default: KeyConfig
     addon: KeyConfig
 
+# Last keyconfig set, keyed by the addresses of the keyconfigs collection and active keyconfig.
+# Python wrappers of Blender structs are short-lived, so their `id()` can't be used as key.
+_kcs_cache: Optional[Tuple[Tuple[int, int], KeyConfigSet]] = None
 def get_current_keyconfig_set(context=...) -> KeyConfigSet:
+    global _kcs_cache
     if context is ...:
         context = bpy.context
     kcs = context.window_manager.keyconfigs
-    return KeyConfigSet(active=kcs.active, user=kcs.user, default=kcs.default, addon=kcs.addon)
+    active = kcs.active
+    key = (kcs.as_pointer(), active.as_pointer())
+    if _kcs_cache is not None and _kcs_cache[0] == key:
+        return _kcs_cache[1]
+    keyconfig_set = KeyConfigSet(active=active, user=kcs.user, default=kcs.default, addon=kcs.addon)
+    _kcs_cache = (key, keyconfig_set)
+    return keyconfig_set
 
 def keymap_id(km) -> str:
     return f"{'modal:' if km.is_modal else ''}{km.space_type}.{km.region_type}:{km.name}"
+# Keymap item values that can be remapped
+_REMAPPABLE_VALUES = frozenset(('PRESS', 'RELEASE'))
 def is_remappable_keymap_item(kmi, layout_translation) -> bool:
-    if kmi.map_type != 'KEYBOARD' or kmi.value not in {'PRESS', 'RELEASE'}:
+    if kmi.map_type != 'KEYBOARD' or kmi.value not in _REMAPPABLE_VALUES:
         return False
     return event_type_to_char(kmi.type) in layout_translation.remapped_input_characters
 
 def is_remapped_keymap_item(kmi, layout_translation) -> bool:
-    if kmi.map_type != 'KEYBOARD' or kmi.value not in {'PRESS', 'RELEASE'}:
+    if kmi.map_type != 'KEYBOARD' or kmi.value not in _REMAPPABLE_VALUES:
         return False
     return event_type_to_char(kmi.type) in layout_translation.remapped_output_characters
 
+_SCALAR_PROPERTY_TYPES = frozenset((float, str, bool, int))
 def operator_property_value_to_dict(value) -> Any:
     if isinstance(value, (float, str, bool, int)):
         return value
@@ -182,6 +245,9 @@ def operator_property_value_to_dict(value) -> Any:
     elif isinstance(value, (PropertyGroup, OperatorProperties)):
         return operator_properties_to_dict(value)
     elif hasattr(value, '__len__'):
+        # Fast path for homogeneous arrays of scalars (i.e., `bpy_prop_array`)
+        if value and type(value[0]) in _SCALAR_PROPERTY_TYPES:
+            return list(value)
         return [operator_property_value_to_dict(v) for v in value]
     else:
         logger = kle_logger()
@@ -201,30 +267,83 @@ def operator_properties_to_dict(properties) -> Dict[str, Any]:
 
 
 def compact_operator_properties(properties: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Drop falsy values from nested operator properties, replacing dicts left empty by `None`.
+
+    Nested dicts are traversed iteratively, with an explicit stack of
+    `(items iterator, compacted dict, parent compacted dict, key in parent)` frames.
+    """
     if properties is None:
         return None
-    compacted = {
-        k: compact_operator_properties(v) if isinstance(v, dict) else v
-        for k, v in properties.items()
-        if bool(v)
-    }
+    compacted = {}
+    stack = [(iter(properties.items()), compacted, None, None)]
+    while stack:
+        items, out, parent, parent_key = stack[-1]
+        for k, v in items:
+            if not v:
+                continue
+            if isinstance(v, dict):
+                # Reserve the key position, filled once the nested dict is done
+                out[k] = None
+                stack.append((iter(v.items()), {}, out, k))
+                break
+            out[k] = v
+        else:
+            stack.pop()
+            if parent is not None:
+                parent[parent_key] = out if out else None
     return compacted if compacted else None
 
 
+# Modifier prefixes indexed by `value + 1`, where modifier values are -1 (any), 0 (off) or 1 (held)
+_MOD_STR_HYPER, _MOD_STR_OSKEY, _MOD_STR_CTRL, _MOD_STR_ALT, _MOD_STR_SHIFT = (
+    (f"~{ch}", "", ch) for ch in "@#^!+"
+)
+_MOD_GET = attrgetter('hyper', 'oskey', 'ctrl', 'alt', 'shift', 'key_modifier', 'repeat')
 def kmi_modifier_string(kmi) -> str:
-    hyper, oskey, ctrl, alt, shift = [getattr(kmi, name) for name in ('hyper', 'oskey', 'ctrl', 'alt', 'shift')]
-    key_mod = kmi.key_modifier
-    def op_ch(op, ch) -> str:
-        return f"{'~' if op < 0 else ''}{ch}" if op != 0 else ""
-    return f"{op_ch(hyper, '@')}{op_ch(oskey, '#')}{op_ch(ctrl, '^')}{op_ch(alt, '!')}{op_ch(shift, '+')}{key_mod if key_mod != 'NONE' else ''}{'*' if kmi.repeat else ''}"
-
+    hyper, oskey, ctrl, alt, shift, key_mod, repeat = _MOD_GET(kmi)
+    return "".join((
+        _MOD_STR_HYPER[hyper + 1],
+        _MOD_STR_OSKEY[oskey + 1],
+        _MOD_STR_CTRL[ctrl + 1],
+        _MOD_STR_ALT[alt + 1],
+        _MOD_STR_SHIFT[shift + 1],
+        key_mod if key_mod != 'NONE' else "",
+        "*" if repeat else "",
+    ))
+
+
+def freeze_map(value) -> Any:
+    """
+    Hashable equivalent of a (possibly nested) value, such as operator properties.
 
-@dataclass
+    Values of classes with an `encode_json` class method are frozen from their JSON encoding.
+    """
+    if isinstance(value, dict):
+        return frozenset([(k, freeze_map(v)) for k, v in value.items()])
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(map(freeze_map, value))
+    elif isinstance(value, (list, tuple)):
+        return tuple(map(freeze_map, value))
+    elif hasattr(value.__class__, 'encode_json'):
+        return freeze_map(value.__class__.encode_json(value))
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class KmiFingerprint:
     # idname is used as key in the remapped keys hierarchy for faster lookup
     properties: Optional[Dict[str, Any]]
     propvalue: Optional[str]
     active: bool
+    # Precomputed hashable key, so fingerprints can be compared and used as dict keys cheaply
+    _key: Tuple[Any, Optional[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        key = (freeze_map(self.properties), self.propvalue, self.active)
+        object.__setattr__(self, '_key', key)
+        object.__setattr__(self, '_hash', hash(key))
 
     @classmethod
     def from_kmi(cls, kmi, *, logger=None) -> KmiFingerprint:
@@ -245,6 +364,10 @@ class KmiFingerprint:
 
     @classmethod
     def decode_json(cls, s) -> KmiFingerprint:
+        # Fast path for the shapes written by `encode_json`
+        unpack = _KMI_FINGERPRINT_JSON_SHAPES.get(tuple(map(type, s)))
+        if unpack is not None:
+            return cls(*unpack(s))
         i, l = 0, len(s)
         if i < l and isinstance(s[i], dict):
             properties = s[i]
@@ -275,10 +398,26 @@ class KmiFingerprint:
         return s
 
     def __eq__(self, other):
-        return self.properties == other.properties and self.propvalue == other.propvalue and self.active == other.active
-
-
-@dataclass
+        if not isinstance(other, KmiFingerprint):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
+
+    def __hash__(self):
+        return self._hash
+
+# Element types of each list shape written by `KmiFingerprint.encode_json` -> constructor arguments
+_KMI_FINGERPRINT_JSON_SHAPES: Dict[Tuple[type, ...], Callable[[list], Tuple[Optional[Dict[str, Any]], Optional[str], bool]]] = {
+    (): lambda s: (None, None, True),
+    (dict,): lambda s: (s[0], None, True),
+    (str,): lambda s: (None, s[0], True),
+    (bool,): lambda s: (None, None, s[0]),
+    (dict, str): lambda s: (s[0], s[1], True),
+    (dict, bool): lambda s: (s[0], None, s[1]),
+    (str, bool): lambda s: (None, s[0], s[1]),
+    (dict, str, bool): lambda s: (s[0], s[1], s[2]),
+}
+
+@dataclass(slots=True)
 class KmiAssignmentDiff:
     modifiers: str
     source_char: str
@@ -298,7 +437,11 @@ class KmiAssignmentDiff:
 
     @classmethod
     def decode_json(cls, s) -> KmiAssignmentDiff:
-        i, l = 0, len(s)
+        # Fast path for the shapes written by `encode_json`
+        n = len(s)
+        if (n == 3 or n == 4) and all(type(v) is str for v in s):
+            return cls(*s)
+        i, l = 0, n
         if i < l and isinstance(s[i], str):
             modifiers = s[i]
             i += 1
@@ -328,14 +471,74 @@ class KmiAssignmentDiff:
         return s
 
 
-def resolve_remapped_keymap_item(kmi, per_op_kmi, *, logger=None) -> Optional[Tuple[KmiFingerprint, KmiAssignmentDiff]]:
+def _unique_match(candidates, predicate) -> Tuple[Optional[Any], bool]:
+    """
+    Find the only candidate matching a predicate, stopping as soon as a second match is found.
+
+    Returns `(match, True)` if at most one candidate matches (`match` being `None` if none did),
+    or `(None, False)` if more than one candidate matches.
+    """
+    found = None
+    for t in candidates:
+        if predicate(t):
+            if found is not None:
+                return None, False
+            found = t
+    return found, True
+
+
+def _group_by_fingerprint(per_op_kmi) -> Dict[KmiFingerprint, List[Tuple[KmiFingerprint, KmiAssignmentDiff]]]:
+    """Group the remapped items of an operator by their fingerprint."""
+    grouped = {}
+    for t in per_op_kmi:
+        grouped.setdefault(t[0], []).append(t)
+    return grouped
+
+
+def _cached_fingerprint_groups(cache: Dict[int, Tuple[list, int, Dict]], per_op_kmi) -> Dict[KmiFingerprint, List[Tuple[KmiFingerprint, KmiAssignmentDiff]]]:
+    """
+    Group `per_op_kmi` by fingerprint, reusing the grouping stored in `cache` unless items were appended since.
+    Cache entries keep a reference to their list, so list identities can't be reused while cached.
+    """
+    cached = cache.get(id(per_op_kmi))
+    if cached is None or cached[0] is not per_op_kmi or cached[1] != len(per_op_kmi):
+        cached = cache[id(per_op_kmi)] = (per_op_kmi, len(per_op_kmi), _group_by_fingerprint(per_op_kmi))
+    return cached[2]
+
+
+# Fingerprint groupings for the operators of the last decoded remapped keys journal
+_fingerprint_groups_cache: Optional[Tuple[Dict[str, Any], Dict[int, Tuple[list, int, Dict]]]] = None
+def _fingerprint_groups_for(remapped_keymaps: Dict[str, Any]) -> Dict[int, Tuple[list, int, Dict]]:
+    """Grouping cache to pass to `_cached_fingerprint_groups` for the items of a remapped keys journal."""
+    global _fingerprint_groups_cache
+    cached = _fingerprint_groups_cache
+    if cached is None or cached[0] is not remapped_keymaps:
+        cached = _fingerprint_groups_cache = (remapped_keymaps, {})
+    return cached[1]
+
+
+def resolve_remapped_keymap_item(
+        kmi, per_op_kmi, *, logger=None,
+        per_op_kmi_by_fingerprint: Optional[Dict[KmiFingerprint, List[Tuple[KmiFingerprint, KmiAssignmentDiff]]]]=None,
+) -> Optional[Tuple[KmiFingerprint, KmiAssignmentDiff]]:
+    """
+    Find the remapped item from `per_op_kmi` corresponding to a keymap item.
+
+    If `per_op_kmi_by_fingerprint` is passed, it must be the result of `_group_by_fingerprint(per_op_kmi)`,
+    and will be used to match fingerprints in constant time.
+    """
+    kmi_char = event_type_to_char(kmi.type)
     test_fingerprint = KmiFingerprint.from_kmi(kmi, logger=logger)
-    compatible = [t for t in per_op_kmi if test_fingerprint == t[0]]
-    if len(compatible) == 1:
-        # Single candidate, resolve to it
-        return compatible[0]
-    elif not compatible:
-        if logger:
+    if per_op_kmi_by_fingerprint is not None:
+        compatible = per_op_kmi_by_fingerprint.get(test_fingerprint, ())
+        match, unique = (compatible[0] if compatible else None), len(compatible) <= 1
+    else:
+        match, unique = _unique_match(per_op_kmi, lambda t: test_fingerprint == t[0])
+    if unique:
+        if match is not None:
+            # Single candidate, resolve to it
+            return match
+        if logger and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"  ! no compatible fingerprint found!! ({kmi.idname})\n" +
                 f"    test: {test_fingerprint}" + json_encode_dumps(KmiFingerprint.encode_json(test_fingerprint), indent=2).replace('\n', '\n    ') + '\n' +
@@ -347,35 +550,44 @@ def resolve_remapped_keymap_item(kmi, per_op_kmi, *, logger=None) -> Optional[Tu
         return None
     # if logger:
     #     logger.debug(f"  > more than one compatible fingerprint")
+    if per_op_kmi_by_fingerprint is None:
+        compatible = [t for t in per_op_kmi if test_fingerprint == t[0]]
 
-    kmi_char = event_type_to_char(kmi.type)
+    def matches_after(t) -> bool:
+        return kmi_char == t[1].target_char
+    def matches_before(t) -> bool:
+        return kmi_char == t[1].source_char
 
     # Compare keys before modifiers
-    compatible_after = [t for t in compatible if kmi_char == t[1].target_char]
-    if len(compatible_after) == 1:
-        return compatible_after[0]
-    compatible_before = [t for t in compatible if kmi_char == t[1].source_char]
-    if len(compatible_before) == 1:
-        return compatible_before[0]
+    match, unique = _unique_match(compatible, matches_after)
+    if match is not None:
+        return match
+    match, unique = _unique_match(compatible, matches_before)
+    if match is not None:
+        return match
 
     # Already some built-in shortcuts exist with duplicates that only differ in modifiers
+    # Only computed in this fallback path, and read once rather than once per candidate
     kmi_modifier = kmi_modifier_string(kmi)
-    compatible = [t for t in compatible if kmi_modifier == t[1].modifiers and kmi.value == t[1].value]
+    kmi_value = kmi.value
+    compatible = [t for t in compatible if kmi_modifier == t[1].modifiers and kmi_value == t[1].value]
     if len(compatible) == 1:
         return compatible[0]
     elif not compatible:
         return None
 
     # Compare keys after modifiers
-    compatible_after = [t for t in compatible if kmi_char == t[1].target_char]
-    if len(compatible_after) == 1:
-        return compatible_after[0]
-    compatible_before = [t for t in compatible if kmi_char == t[1].source_char]
-    if len(compatible_before) == 1:
-        return compatible_before[0]
-
-    if len(compatible_after) > 1 or len(compatible_before) > 1:
-        if logger:
+    match, unique_after = _unique_match(compatible, matches_after)
+    if match is not None:
+        return match
+    match, unique_before = _unique_match(compatible, matches_before)
+    if match is not None:
+        return match
+
+    if not unique_after or not unique_before:
+        if logger and logger.isEnabledFor(logging.DEBUG):
+            compatible_after = [t for t in compatible if matches_after(t)]
+            compatible_before = [t for t in compatible if matches_before(t)]
             logger.debug(f"  ! multiple remapped keymap items found for operator '{kmi.idname}': {compatible_after or compatible_before}")
         # return compatible_after[0] if compatible_after else compatible_before[0]
     return None
@@ -385,10 +597,19 @@ def resolve_remapped_keymap_item(kmi, per_op_kmi, *, logger=None) -> Optional[Tu
 # See https://docs.blender.org/api/5.0/bpy.props.html#bpy.props.EnumProperty
 # The keys in `prefs.custom_layouts` are kept referenced until they change,
 # thanks to the cached JSON decoder.
+# The returned item lists are also cached until the custom layouts JSON changes, since
+# Blender calls enum providers on every redraw.
 _layout_items_strings__desc_custom = 'User-defined keyboard layout'
+_layout_enum_cache: Dict[int, Tuple[str, List[Optional[Tuple[str, str, str]]]]] = {}
+_LAYOUT_ENUM_CACHE_ALL = 0
+_LAYOUT_ENUM_CACHE_CUSTOM = 1
 def layout_enum_items(self, context) -> List[Tuple[str, str, str]]:
     """Enum provider for the layout dropdown in Add-on Preferences."""
     prefs = kle_prefs(context)
+    raw = prefs.custom_layouts_json
+    cached = _layout_enum_cache.get(_LAYOUT_ENUM_CACHE_ALL)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
 
     # Built-in layouts
     items = list(LayoutTranslation.built_in_enum_items)
@@ -400,14 +621,21 @@ def layout_enum_items(self, context) -> List[Tuple[str, str, str]]:
             (n, n, _layout_items_strings__desc_custom)
             for n in custom_layouts
         ]
+    _layout_enum_cache[_LAYOUT_ENUM_CACHE_ALL] = (raw, items)
     return items
 def custom_layout_enum_items(self, context) -> List[Tuple[str, str, str]]:
     """Enum provider for the layout dropdown in the keyboard layout editor."""
     prefs = kle_prefs(context)
-    return [
+    raw = prefs.custom_layouts_json
+    cached = _layout_enum_cache.get(_LAYOUT_ENUM_CACHE_CUSTOM)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    items = [
         (n, n, _layout_items_strings__desc_custom)
         for n in prefs.custom_layouts
     ]
+    _layout_enum_cache[_LAYOUT_ENUM_CACHE_CUSTOM] = (raw, items)
+    return items
 
 
 # Property update handlers
@@ -467,6 +695,43 @@ def is_subkey_expanded(subkey, lst):
     return subkey in lst.splitlines()
 
 
+def _arrow_icon(show: bool) -> str:
+    return 'DOWNARROW_HLT' if show else 'RIGHTARROW'
+
+
+# Remapped items shown per operator in the debug display of remapped keymaps, unless all are shown
+_DEBUG_REMAPPED_ITEMS_PAGE_SIZE = 50
+
+# Lines displayed for each fingerprint in the debug display of remapped keymaps.
+# Fingerprints are immutable, so entries never go stale, but the cache is cleared
+# whenever the remapped keys change to avoid keeping unused entries around.
+_debug_fingerprint_json_lines_cache: Dict[KmiFingerprint, Tuple[str, ...]] = {}
+def _debug_fingerprint_json_lines(fingerprint: KmiFingerprint) -> Tuple[str, ...]:
+    lines = _debug_fingerprint_json_lines_cache.get(fingerprint)
+    if lines is None:
+        lines_f = json_encode_dumps(KmiFingerprint.encode_json(fingerprint), indent=2).splitlines()
+        if "[" in lines_f: lines_f.remove("[")
+        if "]" in lines_f: lines_f.remove("]")
+        lines = _debug_fingerprint_json_lines_cache[fingerprint] = tuple(lines_f)
+    return lines
+
+# Lines displayed for each layout in the debug display of custom layouts,
+# valid as long as the custom layouts JSON they were generated from is current
+_debug_custom_layout_json_lines_cache: Tuple[str, Dict[str, Tuple[str, ...]]] = ("", {})
+def _debug_custom_layout_json_lines(custom_layouts_json: str, name: str, mapping: Dict[str, str]) -> Tuple[str, ...]:
+    global _debug_custom_layout_json_lines_cache
+    cached_json, cache = _debug_custom_layout_json_lines_cache
+    if cached_json != custom_layouts_json:
+        cache = {}
+        _debug_custom_layout_json_lines_cache = (custom_layouts_json, cache)
+    lines = cache.get(name)
+    if lines is None:
+        lines = json.dumps(mapping, indent=2).splitlines()
+        # Skip the lines with the opening and closing braces
+        lines = cache[name] = tuple(lines[1:-1] if len(lines) > 1 and lines[0] == "{" else lines)
+    return lines
+
+
 class KLEUIStateProperties(PropertyGroup):
     """
     Transient UI state of the KLE add-on, which needs not be saved.
@@ -524,6 +789,11 @@ class KLEUIStateProperties(PropertyGroup):
         description="Subkeys expanded in the debug display of remapped keymaps, newline separated",
         default="",
     )
+    preferences_debug_remapped_keymaps_show_all: BoolProperty(
+        name="Show all remapped items",
+        description=f"Show all remapped items of each operator in the debug display of remapped keymaps, rather than only the first {_DEBUG_REMAPPED_ITEMS_PAGE_SIZE}",
+        default=False,
+    )
     listening_key: StringProperty(
         name="Listening Key",
         description="Which key button is currently waiting for input in the keyboard layout editor, if any",
@@ -555,11 +825,21 @@ class KLEUIStateProperties(PropertyGroup):
         update=on_current_target_layout_update,
     )
 
-def decode_remapped_keys(remapped):
+def decode_remapped_keys(remapped, *, trusted=False):
+    """
+    Decode the remapped keys journal from its JSON representation.
+
+    Pass `trusted=True` only for JSON written by `encode_remapped_keys`, to skip validating its structure.
+    """
+    if remapped is None:
+        return None
+    return _decode_remapped_keys_fast(remapped) if trusted else _decode_remapped_keys_checked(remapped)
+def _decode_remapped_keys_checked(remapped):
+    decode_fingerprint, decode_diff, intern = KmiFingerprint.decode_json, KmiAssignmentDiff.decode_json, sys.intern
     return {
-        keymap_id: {
-            op_id: [
-                (KmiFingerprint.decode_json(item[0]), KmiAssignmentDiff.decode_json(item[1]))
+        intern(keymap_id): {
+            intern(op_id): [
+                (decode_fingerprint(item[0]), decode_diff(item[1]))
                 for item in op_items
                 if isinstance(item, list) and len(item) == 2 and isinstance(item[0], list) and isinstance(item[1], list)
             ]
@@ -568,7 +848,18 @@ def decode_remapped_keys(remapped):
         }
         for keymap_id, keymap_items in remapped.items()
         if isinstance(keymap_id, str) and isinstance(keymap_items, dict) and keymap_items
-    } if remapped is not None else None
+    }
+def _decode_remapped_keys_fast(remapped):
+    decode_fingerprint, decode_diff, intern = KmiFingerprint.decode_json, KmiAssignmentDiff.decode_json, sys.intern
+    return {
+        intern(keymap_id): {
+            intern(op_id): [(decode_fingerprint(f), decode_diff(d)) for f, d in op_items]
+            for op_id, op_items in keymap_items.items()
+        }
+        for keymap_id, keymap_items in remapped.items()
+    }
+def decode_trusted_remapped_keys(remapped):
+    return decode_remapped_keys(remapped, trusted=True)
 def encode_remapped_keys(remapped):
     return {
         keymap_id: {
@@ -581,6 +872,88 @@ def encode_remapped_keys(remapped):
         for keymap_id, keymap_items in remapped.items()
     } if remapped is not None else None
 
+# Decoded values of the JSON-backed preferences, keyed by their JSON string.
+# Blender struct wrappers can't hold Python attributes, so they're stored at module level.
+# The setters store the written value, so reading it back doesn't need to decode it again.
+_custom_layouts_cache: Optional[Tuple[str, Dict[str, Dict[str, str]]]] = None
+_remapped_keys_cache: Optional[Tuple[str, Mapping[str, Any]]] = None
+# Shared read-only value of empty remapped keys, so callers can't mutate it by accident
+_EMPTY_REMAPPED_KEYS: Mapping[str, Any] = MappingProxyType({})
+def _remove_invalid_custom_layouts(custom_layouts: Dict[str, Any]):
+    """
+    Remove in place built-in layouts, layouts that aren't dicts, and non-string keys/values from layouts.
+    """
+    for name in custom_layouts.keys() & LayoutTranslation.built_in_names:
+        del custom_layouts[name]
+    for name, layout in list(custom_layouts.items()):
+        if not isinstance(layout, dict):
+            del custom_layouts[name]
+            continue
+        removed_keys = [
+            qwerty_key for qwerty_key, layout_key in layout.items()
+            if not isinstance(qwerty_key, str) or not isinstance(layout_key, str)]
+        for key in removed_keys:
+            del layout[key]
+
+# Translations of custom layouts, by layout name, valid as long as the custom layouts JSON they were built from
+_layout_translation_cache: Tuple[str, Dict[str, Optional[LayoutTranslation]]] = ("", {})
+
+def _identity(value):
+    return value
+
+# Exported preferences, as (preference, condition, encoder) tuples.
+# The condition is either True or the name of the `export_to_json` argument that enables it.
+_EXPORT_SPEC: Tuple[Tuple[str, Literal[True] | str, Callable[[Any], Any]], ...] = (
+    ("preferred_input_layout", True, _identity),
+    ("preferred_target_layout", True, _identity),
+    ("allow_non_qwerty_target_layouts", True, _identity),
+    ("reapply_on_keymaps_panel", True, _identity),
+    ("reapply_on_keymaps_panel_delay", True, _identity),
+    ("reapply_on_reload", True, _identity),
+    ("reapply_on_reload_delay", True, _identity),
+    ("detect_addon_changes", True, _identity),
+    ("detect_addon_changes_polling_interval", True, _identity),
+    ("show_warning_banner", True, _identity),
+    ("large_warning_button_height", True, _identity),
+    ("large_warning_button_style", True, _identity),
+    ("allow_key_conflicts_in_input_layout", True, _identity),
+    ("logging_enabled", True, _identity),
+    ("logging_level", True, _identity),
+    ("is_emulation_active", True, _identity),
+    ("custom_layouts", 'include_custom_layouts', _identity),
+    ("remapped_keys", 'include_remapped_keymaps', encode_remapped_keys),
+)
+# Preferences imported as is by `import_from_json`
+_IMPORTED_PREFS: Tuple[str, ...] = (
+    "reapply_on_keymaps_panel",
+    "reapply_on_keymaps_panel_delay",
+    "reapply_on_reload",
+    "reapply_on_reload_delay",
+    "detect_addon_changes",
+    "detect_addon_changes_polling_interval",
+    "allow_non_qwerty_target_layouts",
+    "show_warning_banner",
+    "large_warning_button_height",
+    "large_warning_button_style",
+    "allow_key_conflicts_in_input_layout",
+    "logging_enabled",
+    "logging_level",
+)
+# Preferences listed in the debug display of preferences
+_DEBUG_DRAWN_PREFS: Tuple[str, ...] = (
+    'reapply_on_keymaps_panel',
+    'reapply_on_keymaps_panel_delay',
+    'reapply_on_reload',
+    'reapply_on_reload_delay',
+    'detect_addon_changes',
+    'detect_addon_changes_polling_interval',
+    'show_warning_banner',
+    'large_warning_button_style',
+    'allow_key_conflicts_in_input_layout',
+    'logging_level',
+    'is_emulation_active',
+)
+
 class KLEPreferences(AddonPreferences):
     """Add-on preferences storing selected layout, mappings, journal, and UI flags."""
     bl_idname = addon_id
@@ -752,35 +1125,33 @@ class KLEPreferences(AddonPreferences):
     @property
     def custom_layouts(self) -> Dict[str, Dict[str, str]]:
         # TODO: Ideally this would return a frozenmap to enforce setter semantics, but Python's not there yet
+        global _custom_layouts_cache
         json_value = self.custom_layouts_json
+        cached = _custom_layouts_cache
+        if cached is not None and cached[0] == json_value:
+            return cached[1]
         d = json_cached_loads('kle_prefs:custom_layouts', json_value, decode=False) if json_value else {}
         if not isinstance(d, dict):
-            return {}
-        for name in LayoutTranslation.built_in:
-            if name in d:
-                del d[name]
+            d = {}
+        # Validated once per decode, so readers don't need to check the layouts
+        _remove_invalid_custom_layouts(d)
+        _custom_layouts_cache = (json_value, d)
         return d
     @custom_layouts.setter
     def custom_layouts(self, value: Dict[str, Dict[str, str]]):
+        global _custom_layouts_cache
         if not isinstance(value, dict):
             raise ValueError(f"Expected dict, got {type(value)}")
         value = dict(value)
-        for name in LayoutTranslation.built_in:
-            if name in value:
-                del value[name]
-        self.custom_layouts_json = json.dumps(value)
+        _remove_invalid_custom_layouts(value)
+        json_value = json.dumps(value)
+        # Avoid redundant property writes, which trigger Blender updates
+        if json_value != self.custom_layouts_json:
+            self.custom_layouts_json = json_value
+        _custom_layouts_cache = (json_value, value)
 
     def get_custom_layout(self, name: str) -> Optional[Dict[str, str]]:
-        layout = self.custom_layouts.get(name, None)
-        if isinstance(layout, dict):
-            removed_keys = []
-            for qwerty_key, layout_key in layout.items():
-                if not isinstance(qwerty_key, str) or not isinstance(layout_key, str):
-                    removed_keys.append(qwerty_key)
-            for key in removed_keys:
-                del layout[key]
-            return layout
-        return None
+        return self.custom_layouts.get(name, None)
 
     def set_custom_layout(self, name: str, layout: Optional[Dict[str, str]]):
         if is_built_in_layout(name):
@@ -805,6 +1176,8 @@ class KLEPreferences(AddonPreferences):
         layout = self.get_custom_layout(name)
         if layout is None:
             raise ValueError(f"No layout named '{name}'")
+        if layout.get(us_qwerty_key) == new_key:
+            return
         layout[us_qwerty_key] = new_key
         self.set_custom_layout(name, layout)
 
@@ -827,13 +1200,22 @@ class KLEPreferences(AddonPreferences):
     def get_layout_translation(self, name: str) -> Optional[LayoutTranslation]:
         if is_built_in_layout(name):
             return LayoutTranslation.built_in[name]
+        global _layout_translation_cache
+        custom_layouts_json = self.custom_layouts_json
+        cached_json, cache = _layout_translation_cache
+        if cached_json != custom_layouts_json:
+            cache = {}
+            _layout_translation_cache = (custom_layouts_json, cache)
+        if name in cache:
+            return cache[name]
         layout_mapping = self.get_custom_layout(name)
-        return LayoutTranslation.from_dict(layout_mapping) if layout_mapping is not None else None
+        translation = cache[name] = LayoutTranslation.from_dict(layout_mapping) if layout_mapping is not None else None
+        return translation
 
     def get_layout_names(self) -> List[str]:
-        return list(LayoutTranslation.built_in.keys()) + [
-            k for k, v in self.custom_layouts.items() if isinstance(k, str) and isinstance(v, dict)
-        ]
+        names = list(LayoutTranslation.built_in)
+        names.extend(self.custom_layouts)
+        return names
 
     def is_layout_editable(self, layout_name: str):
         if is_built_in_layout(layout_name):
@@ -848,22 +1230,59 @@ class KLEPreferences(AddonPreferences):
         default="",
     )
     @property
-    def remapped_keys(self) -> Optional[Dict[str, Any]]:
+    def remapped_keys(self) -> Mapping[str, Any]:
         # TODO: Ideally this would return a frozenmap to enforce setter semantics, but Python's not there yet
+        global _remapped_keys_cache
+        json_value = self.remapped_keys_json
+        if not json_value:
+            return _EMPTY_REMAPPED_KEYS
+        cached = _remapped_keys_cache
+        if cached is not None and cached[0] == json_value:
+            return cached[1]
         d = json_cached_loads(
-            'kle_prefs:remapped_keys', self.remapped_keys_json,
-            decoder=decode_remapped_keys,
-        ) if self.remapped_keys_json else {}
-        return d if isinstance(d, dict) and d else {}
+            'kle_prefs:remapped_keys', json_value,
+            decoder=decode_trusted_remapped_keys,
+        )
+        d = d if isinstance(d, dict) and d else _EMPTY_REMAPPED_KEYS
+        _remapped_keys_cache = (json_value, d)
+        return d
     @remapped_keys.setter
     def remapped_keys(self, value: Dict[str, Any]):
-        self.remapped_keys_json = json_encode_dumps(value, encoder=encode_remapped_keys)
+        global _remapped_keys_cache
+        json_value = json_encode_dumps(value, encoder=encode_remapped_keys)
+        self.remapped_keys_json = json_value
+        _debug_fingerprint_json_lines_cache.clear()
+        _remapped_keys_cache = (json_value, value if isinstance(value, dict) and value else _EMPTY_REMAPPED_KEYS)
 
     def ui_state(self, context=...) -> KLEUIStateProperties:
         if context is ...:
             context = bpy.context
         return context.window_manager.kle_ui_state
 
+    def _scan_keymaps(
+            self, context, remapped_keymaps, characters: FrozenSet[str], *, remapped_keymaps_only=False,
+    ) -> Iterator[Tuple[KeyMap, KeyMapItem, str, str, Optional[Dict[str, Any]]]]:
+        """
+        Iterate the remappable user keymap items whose character is in `characters`, in a single pass.
+
+        Yields each item alongside its character, its operator id, and the remapped keys journal
+        of its keymap (or `None` if their keymap has no remapped items).
+        The type and operator id of each item are read only once, since each read crosses into Blender.
+        """
+        kcs = get_current_keyconfig_set(context)
+        _keymap_id = keymap_id
+        _ev2c = event_type_to_char
+        for km in kcs.user.keymaps:
+            remapped_km = remapped_keymaps.get(_keymap_id(km))
+            if remapped_km is None and remapped_keymaps_only:
+                continue
+            for kmi in km.keymap_items:
+                if kmi.map_type != 'KEYBOARD' or kmi.value not in _REMAPPABLE_VALUES:
+                    continue
+                char = _ev2c(kmi.type)
+                if char in characters:
+                    yield km, kmi, char, kmi.idname, remapped_km
+
     def remapped_keymap_items(self, context=...) -> Iterator[Tuple[KeyMap, KeyMapItem, KmiFingerprint, KmiAssignmentDiff]]:
         if context is ...:
             context = bpy.context
@@ -872,95 +1291,97 @@ class KLEPreferences(AddonPreferences):
         remapped_keymaps = self.remapped_keys
         if not remapped_keymaps:
             return
-        kcs = get_current_keyconfig_set(context)
 
-        layout_translation = self.get_preferred_layout_translation()
-        for km in kcs.user.keymaps:
-            km_id = keymap_id(km)
-            if km_id not in remapped_keymaps:
+        _resolve = resolve_remapped_keymap_item
+        fingerprint_groups = _fingerprint_groups_for(remapped_keymaps)
+        for km, kmi, char, op, remapped_km in self._scan_keymaps(
+                context, remapped_keymaps, self.get_preferred_layout_translation().remapped_output_characters,
+                remapped_keymaps_only=True):
+            remapped_op = remapped_km.get(op)
+            if remapped_op is None:
                 continue
-            remapped_km = remapped_keymaps[km_id]
-            for kmi in km.keymap_items:
-                if not is_remapped_keymap_item(kmi, layout_translation):
-                    continue
-                op = kmi.idname
-                if not op in remapped_km:
-                    continue
-                remapped_op = remapped_km[op]
-                rs = resolve_remapped_keymap_item(kmi, remapped_op, logger=logger)
-                if rs is not None:
-                    yield km, kmi, rs[0], rs[1]
-                else:
-                    if logger:
-                        logger.debug(
-                            f"  ! unresolved kmi: {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
-                            f"    fingerprint: " + json_encode_dumps(KmiFingerprint.encode_json(KmiFingerprint.from_kmi(kmi, logger=logger)), indent=2).replace('\n', '\n    ') + '\n' +
-                            f"    candidates: " + json_encode_dumps([
-                                [KmiFingerprint.encode_json(fingerprint), KmiAssignmentDiff.encode_json(diff)]
-                                for fingerprint, diff in remapped_op
-                            ], indent=2).replace('\n', '\n    ')
-                        )
-
-    def pending_keymaps_to_emulate(self, context=...) -> Iterator[Tuple[KeyMap, KeyMapItem, Optional[KmiFingerprint], Optional[KmiAssignmentDiff]]]:
+            rs = _resolve(
+                kmi, remapped_op, logger=logger,
+                per_op_kmi_by_fingerprint=_cached_fingerprint_groups(fingerprint_groups, remapped_op))
+            if rs is not None:
+                yield km, kmi, rs[0], rs[1]
+            elif logger and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"  ! unresolved kmi: {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
+                    f"    fingerprint: " + json_encode_dumps(KmiFingerprint.encode_json(KmiFingerprint.from_kmi(kmi, logger=logger)), indent=2).replace('\n', '\n    ') + '\n' +
+                    f"    candidates: " + json_encode_dumps([
+                        [KmiFingerprint.encode_json(fingerprint), KmiAssignmentDiff.encode_json(diff)]
+                        for fingerprint, diff in remapped_op
+                    ], indent=2).replace('\n', '\n    ')
+                )
+
+    def pending_keymaps_to_emulate(
+            self, context=..., *, layout_translation: Optional[LayoutTranslation]=None,
+    ) -> Iterator[Tuple[KeyMap, KeyMapItem, Optional[KmiFingerprint], Optional[KmiAssignmentDiff]]]:
         if context is ...:
             context = bpy.context
         logger = kle_logger(context)
+        if layout_translation is None:
+            layout_translation = self.get_preferred_layout_translation()
 
         remapped_keymaps = self.remapped_keys
         if not remapped_keymaps:
             remapped_keymaps = {}
-        kcs = get_current_keyconfig_set(context)
         # user_keymap_names = {km.name for km in kcs.user.keymaps}
 
         # if logger:
         #     logger.debug(f"Potential keymaps ({len(kcs.user.keymaps)}): {[keymap_id(km) for km in kcs.user.keymaps]}")
-        layout_translation = self.get_preferred_layout_translation()
-        for km in kcs.user.keymaps:
-            km_id = keymap_id(km)
-            if km_id not in remapped_keymaps:
-                for kmi in km.keymap_items:
-                    if is_remappable_keymap_item(kmi, layout_translation):
-                        # # This seems to be the case for `node.duplicate_move_linked` & friends, for some reason
-                        # if logger and kmi.idname == 'node.duplicate_move_linked':
-                        #     logger.debug(
-                        #         f"  !! unresolved duplicate kmi km: {km_id} {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
-                        #         f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
-                        #         f"     candidates: " + ', '.join(remapped_keymaps.keys())
-                        #     )
-                        yield km, kmi, None, None
+        _resolve = resolve_remapped_keymap_item
+        fingerprint_groups = _fingerprint_groups_for(remapped_keymaps)
+        for km, kmi, char, op, remapped_km in self._scan_keymaps(
+                context, remapped_keymaps, layout_translation.remapped_input_characters):
+            if remapped_km is None:
+                # # This seems to be the case for `node.duplicate_move_linked` & friends, for some reason
+                # if logger and kmi.idname == 'node.duplicate_move_linked':
+                #     logger.debug(
+                #         f"  !! unresolved duplicate kmi km: {keymap_id(km)} {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
+                #         f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
+                #         f"     candidates: " + ', '.join(remapped_keymaps.keys())
+                #     )
+                yield km, kmi, None, None
+                continue
+            remapped_op = remapped_km.get(op)
+            if remapped_op is None:
+                # if logger and kmi.idname == 'node.duplicate_move_linked':
+                #     logger.debug(
+                #         f"  !! unresolved duplicate kmi op: {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
+                #         # f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
+                #         f"     candidates: " + ', '.join(remapped_km.keys())
+                #     )
+                yield km, kmi, None, None
+                continue
+            rs = _resolve(
+                kmi, remapped_op, logger=logger,
+                per_op_kmi_by_fingerprint=_cached_fingerprint_groups(fingerprint_groups, remapped_op))
+            if rs is None:
+                yield km, kmi, None, None
             else:
-                remapped_km = remapped_keymaps[km_id]
-                for kmi in km.keymap_items:
-                    if not is_remappable_keymap_item(kmi, layout_translation):
-                        continue
-                    op = kmi.idname
-                    if not op in remapped_km:
-                        # if logger and kmi.idname == 'node.duplicate_move_linked':
-                        #     logger.debug(
-                        #         f"  !! unresolved duplicate kmi op: {kmi.idname} ({kmi.name}) -> {kmi_modifier_string(kmi)} & {kmi.type}\n" +
-                        #         # f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
-                        #         f"     candidates: " + ', '.join(remapped_km.keys())
-                        #     )
-                        yield km, kmi, None, None
-                        continue
-                    rs = resolve_remapped_keymap_item(kmi, remapped_km[op], logger=logger)
-                    if rs is None:
-                        yield km, kmi, None, None
-                    else:
-                        fingerprint, diff = rs
-                        if event_type_to_char(kmi.type) == diff.source_char:
-                            # if logger and kmi.idname == 'node.duplicate_move_linked':
-                            #     logger.debug(
-                            #         f"  !! unresolved duplicate kmi: {rs}, ({kmi.type})\n" +
-                            #         f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
-                            #         f"     candidates: " + json_set_dumps(remapped_km[op], indent=2).replace('\n', '\n    ')
-                            #     )
-                            yield km, kmi, fingerprint, diff
+                fingerprint, diff = rs
+                if char == diff.source_char:
+                    # if logger and kmi.idname == 'node.duplicate_move_linked':
+                    #     logger.debug(
+                    #         f"  !! unresolved duplicate kmi: {rs}, ({kmi.type})\n" +
+                    #         f"     props: " + json_set_dumps(compact_operator_properties(operator_properties_to_dict(kmi.properties)), indent=2).replace('\n', '\n    ') + '\n' +
+                    #         f"     candidates: " + json_set_dumps(remapped_op, indent=2).replace('\n', '\n    ')
+                    #     )
+                    yield km, kmi, fingerprint, diff
 
     def has_pending_keymaps_to_emulate(self):
-        return next(self.pending_keymaps_to_emulate(), None) is not None
+        layout_translation = self.get_preferred_layout_translation()
+        if layout_translation.is_identity():
+            # No keymap item can be remapped, skip scanning the keymaps
+            return False
+        return next(self.pending_keymaps_to_emulate(layout_translation=layout_translation), None) is not None
     def bounded_number_of_pending_keymaps_to_emulate(self, limit: int = 100) -> Optional[int]:
-        it = iter(self.pending_keymaps_to_emulate())
+        layout_translation = self.get_preferred_layout_translation()
+        if layout_translation.is_identity():
+            return 0
+        it = iter(self.pending_keymaps_to_emulate(layout_translation=layout_translation))
         for i in range(limit):
             if next(it, None) is None:
                 return i
@@ -985,9 +1406,11 @@ class KLEPreferences(AddonPreferences):
         )
 
         # Storage data preview
+        # Only the headers of collapsed sections are drawn, so the JSON-backed properties
+        # are only read (and decoded) within the branches of their expanded sections
         ui_state = self.ui_state(context)
-        def arrow_icon(show: bool) -> str:
-            return 'DOWNARROW_HLT' if show else 'RIGHTARROW'
+        arrow_icon = _arrow_icon
+        debug_visible = ui_state.preferences_debug_visible
 
         box = column.box()
         col = box.column()
@@ -998,7 +1421,7 @@ class KLEPreferences(AddonPreferences):
         header_left.prop(
             ui_state, "preferences_debug_visible",
             text="Debug add-on preferences", emboss=False,
-            icon=arrow_icon(ui_state.preferences_debug_visible))
+            icon=arrow_icon(debug_visible))
 
         ir = header_right.row(align=True)
         # if self.is_emulation_active:
@@ -1013,46 +1436,37 @@ class KLEPreferences(AddonPreferences):
             text="Export...", icon='EXPORT',
         )
 
-        if ui_state.preferences_debug_visible:
+        if debug_visible:
             indent_factor = 0.02
             split = col.column().split(factor=indent_factor)
             _, col = split.column(), split.column()
 
+            general_prefs_visible = ui_state.preferences_debug_general_prefs_visible
             header = col.row(align=True)
             header.alignment = 'LEFT'
             header.prop(
                 ui_state, "preferences_debug_general_prefs_visible",
                 text="Preferences", emboss=False,
-                icon=arrow_icon(ui_state.preferences_debug_general_prefs_visible))
-            if ui_state.preferences_debug_general_prefs_visible:
+                icon=arrow_icon(general_prefs_visible))
+            if general_prefs_visible:
                 split = col.row().split(factor=indent_factor * 2)
                 _, right = split.column(), split.column()
                 right.label(text=f"preferred_input_layout: {self.hidden__preferred_input_layout}", icon='DOT')
                 right.label(text=f"preferred_target_layout: {self.hidden__preferred_target_layout}", icon='DOT')
-                for prop in (
-                    'reapply_on_keymaps_panel',
-                    'reapply_on_keymaps_panel_delay',
-                    'reapply_on_reload',
-                    'reapply_on_reload_delay',
-                    'detect_addon_changes',
-                    'detect_addon_changes_polling_interval',
-                    'show_warning_banner',
-                    'large_warning_button_style',
-                    'allow_key_conflicts_in_input_layout',
-                    'logging_level',
-                    'is_emulation_active',
-                ):
+                for prop in _DEBUG_DRAWN_PREFS:
                     right.label(text=f"{prop}: {getattr(self, prop)}", icon='DOT')
 
+            custom_layouts_visible = ui_state.preferences_debug_custom_layouts_visible
             header = col.row(align=True)
             header.alignment = 'LEFT'
             header.prop(
                 ui_state, "preferences_debug_custom_layouts_visible",
                 text="Custom Layouts", emboss=False,
-                icon=arrow_icon(ui_state.preferences_debug_custom_layouts_visible))
-            if ui_state.preferences_debug_custom_layouts_visible:
+                icon=arrow_icon(custom_layouts_visible))
+            if custom_layouts_visible:
                 split = col.row().split(factor=indent_factor)
                 _, right = split.column(), split.column()
+                custom_layouts_json = self.custom_layouts_json
                 for name, mapping in self.custom_layouts.items():
                     expanded = is_subkey_expanded(name, ui_state.preferences_debug_custom_layouts_expanded_subkeys)
                     row = right.row()
@@ -1076,20 +1490,19 @@ class KLEPreferences(AddonPreferences):
                     if expanded:
                         split = right.row().split(factor=indent_factor)
                         _, cc = split.column(), split.column()
-                        lines = json.dumps(mapping, indent=2).splitlines()
-                        if "{" in lines: lines.remove("{")
-                        if "}" in lines: lines.remove("}")
-                        for line in lines:
+                        for line in _debug_custom_layout_json_lines(custom_layouts_json, name, mapping):
                             cc.label(text=line)
 
+            remapped_keymaps_visible = ui_state.preferences_debug_remapped_keymaps_visible
             header = col.row(align=True)
             header.alignment = 'LEFT'
             header.prop(
                 ui_state, "preferences_debug_remapped_keymaps_visible",
                 text="Remapped keymaps", emboss=False,
-                icon=arrow_icon(ui_state.preferences_debug_remapped_keymaps_visible))
-            if ui_state.preferences_debug_remapped_keymaps_visible:
+                icon=arrow_icon(remapped_keymaps_visible))
+            if remapped_keymaps_visible:
                 remapped_expanded_subkeys = ui_state.preferences_debug_remapped_keymaps_expanded_subkeys
+                show_all_items = ui_state.preferences_debug_remapped_keymaps_show_all
                 remapped_expanded_subkeys_prop = 'preferences_debug_remapped_keymaps_expanded_subkeys'
 
                 split = col.row().split(factor=indent_factor)
@@ -1128,7 +1541,9 @@ class KLEPreferences(AddonPreferences):
                             if op_expanded:
                                 split = ccc.row().split(factor=indent_factor)
                                 _, cccc = split.column(), split.column()
-                                for i, (fingerprint, diff) in enumerate(op_list):
+                                shown_items = len(op_list) if show_all_items else min(len(op_list), _DEBUG_REMAPPED_ITEMS_PAGE_SIZE)
+                                for i in range(shown_items):
+                                    fingerprint, diff = op_list[i]
                                     info_subkey = f"{op_subkey}:{i}"
                                     info_expanded = is_subkey_expanded(info_subkey, remapped_expanded_subkeys)
                                     row = cccc.row()
@@ -1147,15 +1562,20 @@ class KLEPreferences(AddonPreferences):
                                     if info_expanded:
                                         split = cccc.row().split(factor=indent_factor)
                                         _, ccccc = split.column(), split.column()
-                                        lines_f = json_encode_dumps(KmiFingerprint.encode_json(fingerprint), indent=2).splitlines()
-                                        if "[" in lines_f: lines_f.remove("[")
-                                        if "]" in lines_f: lines_f.remove("]")
+                                        lines_f = list(_debug_fingerprint_json_lines(fingerprint))
                                         if lines_f:
                                             lines_f[-1] = lines_f[-1] + ','
                                         line_d = json_encode_dumps(KmiAssignmentDiff.encode_json(diff))
                                         for line in lines_f + [line_d]:
                                             ccccc.label(text=line)
+                                if len(op_list) > _DEBUG_REMAPPED_ITEMS_PAGE_SIZE:
+                                    row = cccc.row()
+                                    row.alignment = 'LEFT'
+                                    if shown_items < len(op_list):
+                                        row.label(text=f"… {len(op_list) - shown_items} more")
+                                    row.prop(ui_state, "preferences_debug_remapped_keymaps_show_all", text="Show all", toggle=True)
 
+        uninstall_options_visible = ui_state.uninstall_options_visible
         box = column.box()
         col = box.column()
         header = col.row(align=True)
@@ -1163,9 +1583,9 @@ class KLEPreferences(AddonPreferences):
         header.prop(
             ui_state, "uninstall_options_visible",
             text="Uninstall options", emboss=False,
-            icon=arrow_icon(ui_state.uninstall_options_visible))
+            icon=arrow_icon(uninstall_options_visible))
 
-        if ui_state.uninstall_options_visible:
+        if uninstall_options_visible:
             indent_factor = 0.02
             split = col.column().split(factor=indent_factor)
             _, opt_col = split.column(), split.column()
@@ -1184,35 +1604,18 @@ class KLEPreferences(AddonPreferences):
             include_custom_layouts=True,
             include_remapped_keymaps=False
     ) -> str:
+        include = {
+            'include_custom_layouts': include_custom_layouts,
+            'include_remapped_keymaps': include_remapped_keymaps,
+        }
+        exported_prefs = {}
+        for pref, condition, encode in _EXPORT_SPEC:
+            if condition is True or include[condition]:
+                exported_prefs[pref] = encode(getattr(self, pref))
         return json_encode_dumps({
             "addon_id": addon_id,
             "preferences_version": preferences_version,
-            "preferences": {
-                pref: encode(getattr(self, pref)) for pref, condition, encode in [
-                    (pref, True, lambda v: v) if isinstance(pref, str)
-                    else (*pref, lambda v: v) if len(pref) == 2 else pref
-                    for pref in [
-                        "preferred_input_layout",
-                        "preferred_target_layout",
-                        "allow_non_qwerty_target_layouts",
-                        "reapply_on_keymaps_panel",
-                        "reapply_on_keymaps_panel_delay",
-                        "reapply_on_reload",
-                        "reapply_on_reload_delay",
-                        "detect_addon_changes",
-                        "detect_addon_changes_polling_interval",
-                        "show_warning_banner",
-                        "large_warning_button_height",
-                        "large_warning_button_style",
-                        "allow_key_conflicts_in_input_layout",
-                        "logging_enabled",
-                        "logging_level",
-                        "is_emulation_active",
-                        ("custom_layouts", include_custom_layouts),
-                        ("remapped_keys", include_remapped_keymaps, encode_remapped_keys),
-                    ]
-                ] if condition
-            },
+            "preferences": exported_prefs,
         }, indent=2)
 
     def import_from_json(
@@ -1250,14 +1653,15 @@ class KLEPreferences(AddonPreferences):
                 ui_state.is_emulation_applied = False
 
             # Preserve emulated layouts
+            current_custom_layouts = self.custom_layouts
             locked_input_custom_layout = self.preferred_input_layout if self.is_emulation_active and not ignore_emulation_lock else None
             if is_built_in_layout(locked_input_custom_layout):
                 locked_input_custom_layout = None
-            locked_input_custom_layout_value = dict(self.custom_layouts.get(locked_input_custom_layout, {})) if locked_input_custom_layout is not None else None
+            locked_input_custom_layout_value = dict(current_custom_layouts.get(locked_input_custom_layout, {})) if locked_input_custom_layout is not None else None
             locked_output_custom_layout = self.preferred_target_layout if self.is_emulation_active and not ignore_emulation_lock else None
             if is_built_in_layout(locked_output_custom_layout):
                 locked_output_custom_layout = None
-            locked_output_custom_layout_value = dict(self.custom_layouts.get(locked_output_custom_layout, {})) if locked_output_custom_layout is not None else None
+            locked_output_custom_layout_value = dict(current_custom_layouts.get(locked_output_custom_layout, {})) if locked_output_custom_layout is not None else None
 
             if not self.is_emulation_active or import_emulation_status or ignore_emulation_lock:
                 self.preferred_input_layout = p.get('preferred_input_layout', self.preferred_input_layout)
@@ -1265,33 +1669,19 @@ class KLEPreferences(AddonPreferences):
                 if import_emulation_status or ignore_emulation_lock:
                     self.is_emulation_active = p.get('is_emulation_active', self.is_emulation_active)
 
-            for imported_pref in [
-                "reapply_on_keymaps_panel",
-                "reapply_on_keymaps_panel_delay",
-                "reapply_on_reload",
-                "reapply_on_reload_delay",
-                "detect_addon_changes",
-                "detect_addon_changes_polling_interval",
-                "allow_non_qwerty_target_layouts",
-                "show_warning_banner",
-                "large_warning_button_height",
-                "large_warning_button_style",
-                "allow_key_conflicts_in_input_layout",
-                "logging_enabled",
-                "logging_level",
-            ]:
+            for imported_pref in _IMPORTED_PREFS:
                 setattr(self, imported_pref, p.get(imported_pref, getattr(self, imported_pref)))
 
             if overwrite_custom_layouts:
                 custom_layouts = p.get('custom_layouts', {})
             elif update_custom_layouts:
-                custom_layouts = self.custom_layouts
+                custom_layouts = dict(current_custom_layouts)
                 custom_layouts.update(p.get('custom_layouts', {}))
             elif inverse_update_custom_layouts:
                 custom_layouts = p.get('custom_layouts', {})
-                custom_layouts.update(self.custom_layouts)
+                custom_layouts.update(current_custom_layouts)
             else:
-                custom_layouts = self.custom_layouts
+                custom_layouts = current_custom_layouts
 
             if locked_input_custom_layout is not None:
                 custom_layouts[locked_input_custom_layout] = locked_input_custom_layout_value
@@ -1,6 +1,5 @@
 from __future__ import annotations
-import time
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Mapping, NamedTuple, Tuple, Union
 
 import bpy
 # noinspection PyUnresolvedReferences
@@ -11,6 +10,20 @@ from .preferences import kle_prefs, KLEPreferencesUnavailableException
 from .operators import KLEOperators
 from .constants import KLELinks
 
+# Operator ids used while drawing, bound once rather than looked up on every draw
+_OP_CAPTURE = KLEOperators.capture_key_for_mapping
+_OP_NONEDIT = KLEOperators.Info.non_editable_key
+_OP_APPLY = KLEOperators.apply_layout_emulation
+_OP_REVERT = KLEOperators.revert_layout_emulation
+_OP_LOCKED = KLEOperators.Info.layout_locked
+_OP_UNLOCKED = KLEOperators.Info.layout_unlocked
+_OP_ADD = KLEOperators.add_custom_layout
+_OP_REMOVE = KLEOperators.remove_custom_layout
+_OP_RENAME = KLEOperators.rename_custom_layout
+_OP_IMPORT_LAYOUT = KLEOperators.import_layout_json
+_OP_EXPORT_LAYOUT = KLEOperators.export_layout_json
+_OP_ADDON_INFO = KLEOperators.Info.addon_info
+
 # Layout used to render a keyboard-like button grid
 from sys import platform
 KEYBOARD_EDITOR_LAYOUT: List[List[Dict[str, object]]] = [
@@ -67,20 +80,123 @@ KEYBOARD_EDITOR_LAYOUT: List[List[Dict[str, object]]] = [
         ],
 ]
 
-# Transient state to conflate reapply requests
-_keymap_prefs_reapply_requested = False
+class _EditorKey(NamedTuple):
+    """Key of the keyboard editor, either editable (with a QWERTY character) or not (with a label)."""
+    editable: bool
+    ch: str = ""
+    label: str = ""
+    w: float = 1.0
+
+class _EditorSplit(NamedTuple):
+    """Split of a range of keys of a keyboard editor row in two halves, proportional to their widths."""
+    factor: float
+    left: Union[_EditorSplit, _EditorKey]
+    right: Union[_EditorSplit, _EditorKey]
+
+def _editor_split_tree(keys: Tuple[_EditorKey, ...]) -> Union[_EditorSplit, _EditorKey, None]:
+    """
+    Split a row of keys recursively in halves, so the split factors aren't computed on every draw.
+    """
+    if not keys:
+        return None
+    if len(keys) == 1:
+        return keys[0]
+    split_idx = len(keys) // 2
+    left_weight = sum(k.w for k in keys[:split_idx])
+    factor = left_weight / (left_weight + sum(k.w for k in keys[split_idx:]))
+    return _EditorSplit(factor, _editor_split_tree(keys[:split_idx]), _editor_split_tree(keys[split_idx:]))
+
+# Split trees of each row of `KEYBOARD_EDITOR_LAYOUT`, computed once rather than on every draw
+_KEYBOARD_EDITOR_ROWS: Tuple[Union[_EditorSplit, _EditorKey, None], ...] = tuple(
+    _editor_split_tree(tuple(
+        _EditorKey(True, ch=str(k.get("ch", "")), w=k.get('w', 1.0)) if 'ch' in k
+        else _EditorKey(False, label=str(k.get("label", "")), w=k.get('w', 1.0))
+        for k in keys))
+    for keys in KEYBOARD_EDITOR_LAYOUT)
+
+# The `event_handlers` module, imported lazily since it isn't needed to draw
+_event_handlers_module = None
+
+def _event_handlers():
+    global _event_handlers_module
+    if _event_handlers_module is None:
+        from . import event_handlers
+        _event_handlers_module = event_handlers
+    return _event_handlers_module
+
+# Timer of the pending reapply request, to conflate reapply requests
+_reapply_timer = None
+
+# Maximum number of pending keymap items counted for the Re-Apply button
+_REAPPLY_PENDING_BOUND = 99
+_BOUND_PLUS = f"{_REAPPLY_PENDING_BOUND}+"
+
+# Toggles shown in the add-on preferences subpanel, with the value they enable
+_DELAYED_PREFS = (
+    ("reapply_on_keymaps_panel", "Reapply automatically here", "reapply_on_keymaps_panel_delay", "Delay"),
+    ("reapply_on_reload", "Reapply emulation on restart", "reapply_on_reload_delay", "Delay"),
+    ("detect_addon_changes", "Detect add-on installation", "detect_addon_changes_polling_interval", "Interval"),
+)
 
 def reapply_from_keymap_prefs():
-    global _keymap_prefs_reapply_requested
-    from .event_handlers import on_reapply_requested
-    on_reapply_requested()
-    _keymap_prefs_reapply_requested = False
+    global _reapply_timer
+    _reapply_timer = None
+    _event_handlers().on_reapply_requested()
+
+def _draw_key(
+        cell, key: _EditorKey,
+        in_out: Mapping[str, str], conflicting_keys: FrozenSet[str], has_conflicts: bool,
+        layout_name: str, listening_key: str):
+    """
+    Draw a single key of the keyboard editor in its own cell.
+
+    `has_conflicts` must be whether `conflicting_keys` is non-empty, to skip looking up keys in the common case.
+    """
+    if key.editable:
+        qw_ch = key.ch
+        if qw_ch:
+            is_listening = listening_key == qw_ch
+            ch = in_out.get(qw_ch, qw_ch)
+            label = '...' if is_listening else ch
+            red = has_conflicts and ch in conflicting_keys and not is_listening
+            if red:
+                cell.alert = True
+                # label = f'[{label}]'
+            op = cell.operator(
+                _OP_CAPTURE,
+                text=label,
+                depress=is_listening,
+            )
+            op.physical = qw_ch
+            op.layout = layout_name
+    else:
+        # Non-editable key: render grayed-out button for context
+        cell.enabled = False
+        cell.operator(_OP_NONEDIT, text=key.label)
+
+def _draw_keys(
+        parent_layout, node: Union[_EditorSplit, _EditorKey],
+        in_out: Mapping[str, str], conflicting_keys: FrozenSet[str], has_conflicts: bool,
+        layout_name: str, listening_key: str):
+    """
+    Draw the keys of a split tree of a keyboard editor row, following its precomputed splits.
+    """
+    if isinstance(node, _EditorKey):
+        _draw_key(parent_layout, node, in_out, conflicting_keys, has_conflicts, layout_name, listening_key)
+        return
+    split_layout = parent_layout.split(factor=node.factor)  # align=True
+    _draw_keys(
+        split_layout.row(align=True), node.left, in_out,
+        conflicting_keys, has_conflicts, layout_name, listening_key)
+    _draw_keys(
+        split_layout.row(align=True), node.right, in_out,
+        conflicting_keys, has_conflicts, layout_name, listening_key)
 
 def draw_in_keymap_prefs(self, context):
     """
     Prepended block shown inside Keymap preferences panel.
     """
-    global _keymap_prefs_reapply_requested
+    global _reapply_timer
 
     prefs = kle_prefs(context)
     ui_state = prefs.ui_state(context)
@@ -89,12 +205,16 @@ def draw_in_keymap_prefs(self, context):
     box = ui_layout.box()
     col = box.column(align=True)
 
+    # Preferences read once per draw, since each read crosses into Blender
     target_layout_name = prefs.preferred_target_layout
     layout_name = prefs.preferred_input_layout
     if layout_name is None:
         layout_name = 'QWERTY'
-    is_built_in = is_built_in_layout(layout_name)
     is_emulation_active = prefs.is_emulation_active
+    allow_key_conflicts = prefs.allow_key_conflicts_in_input_layout
+    show_warning_banner = prefs.show_warning_banner
+    show_preferences = ui_state.show_keyboard_layout_emulation_preferences
+    show_editor = ui_state.show_keyboard_layout_editor
     input_layout_mapping = prefs.get_layout_translation(layout_name)
     target_layout_mapping = prefs.get_layout_translation(target_layout_name)
 
@@ -106,9 +226,9 @@ def draw_in_keymap_prefs(self, context):
     # Layout selector disabled when a keymap has this layout applied
     li = left.row(align=False)
     if is_emulation_active:
-        li.operator(KLEOperators.Info.layout_locked, text="", icon='LOCKED', emboss=False)
+        li.operator(_OP_LOCKED, text="", icon='LOCKED', emboss=False)
     else:
-        li.operator(KLEOperators.Info.layout_unlocked, text="", icon='UNLOCKED', emboss=False)
+        li.operator(_OP_UNLOCKED, text="", icon='UNLOCKED', emboss=False)
     lr = left.row(align=True)
     lr.enabled = not is_emulation_active
     split = lr.split(factor=0.30, align=True)
@@ -121,12 +241,12 @@ def draw_in_keymap_prefs(self, context):
     icon_row = lr_input.row(align=False)
     icon_row.label(text="", icon="BACK")
     lr_input.prop(ui_state, "current_input_layout", text="")
-    op = lr_input.operator(KLEOperators.add_custom_layout, text="", icon='ADD')
+    op = lr_input.operator(_OP_ADD, text="", icon='ADD')
     op.template = layout_name
     op.name = f"{layout_name} (copy)"
-    lr_input.operator(KLEOperators.remove_custom_layout, text="", icon='REMOVE').layout = layout_name
+    lr_input.operator(_OP_REMOVE, text="", icon='REMOVE').layout = layout_name
     er = left.row(align=True)
-    if not input_layout_mapping.is_valid() and not prefs.allow_key_conflicts_in_input_layout:
+    if not allow_key_conflicts and not input_layout_mapping.is_valid():
         er.alert = True
     er.prop(
         ui_state, "show_keyboard_layout_editor",
@@ -136,25 +256,28 @@ def draw_in_keymap_prefs(self, context):
     # Right: Apply / Revert, right-aligned
     # right.alignment = 'RIGHT'
     ar = right.row(align=True)
-    is_emulation_active = prefs.is_emulation_active
-    has_pending_keymaps_to_apply = prefs.has_pending_keymaps_to_emulate()
     label = "Apply"
+    if is_emulation_active:
+        # The bounded count also tells whether there are pending items, no need to scan twice
+        pending_number = prefs.bounded_number_of_pending_keymaps_to_emulate(_REAPPLY_PENDING_BOUND)
+        has_pending_keymaps_to_apply = pending_number != 0
+    else:
+        has_pending_keymaps_to_apply = prefs.has_pending_keymaps_to_emulate()
     if is_emulation_active and has_pending_keymaps_to_apply:
-        if prefs.reapply_on_keymaps_panel and not _keymap_prefs_reapply_requested:
+        if prefs.reapply_on_keymaps_panel and (
+                _reapply_timer is None or not bpy.app.timers.is_registered(_reapply_timer)):
             bpy.app.timers.register(reapply_from_keymap_prefs, first_interval=prefs.reapply_on_keymaps_panel_delay)
-            _keymap_prefs_reapply_requested = True
+            _reapply_timer = reapply_from_keymap_prefs
         # label = "Re-Apply?"
-        bound = 99
-        pending_number = prefs.bounded_number_of_pending_keymaps_to_emulate(bound)
-        label = f"Re-Apply ({pending_number if pending_number is not None else str(bound) + '+'})"
+        label = f"Re-Apply ({pending_number if pending_number is not None else _BOUND_PLUS})"
     ar.enabled = has_pending_keymaps_to_apply
-    ar.operator(KLEOperators.apply_layout_emulation, text=label, icon='ANIM')
+    ar.operator(_OP_APPLY, text=label, icon='ANIM')
     rr = right.row(align=True)
     rr.enabled = is_emulation_active
     # if is_emulation_active:
     #     rr.alert = True
     rr.operator(
-        KLEOperators.revert_layout_emulation, text="Revert", icon='LOOP_BACK'
+        _OP_REVERT, text="Revert", icon='LOOP_BACK'
     ).request_confirmation = False
     right.separator()
     sr = right.row(align=False)
@@ -164,56 +287,45 @@ def draw_in_keymap_prefs(self, context):
     )
 
     # Add-on preferences
-    if ui_state.show_keyboard_layout_emulation_preferences:
+    if show_preferences:
         col.separator()
         sub = col.box()
         header = sub.row()
         header.label(text="Keyboard layout emulation preferences")
         header_right = header.row(align=False)
         header_right.alignment = 'RIGHT'
-        header_right.operator(KLEOperators.Info.addon_info, text="More info", icon='QUESTION', emboss=False)
+        header_right.operator(_OP_ADDON_INFO, text="More info", icon='QUESTION', emboss=False)
         header_right.operator("wm.url_open", text="Help", icon='URL').url = KLELinks.help
-        row = sub.column(align=False)
-        split = row.split(factor=0.52, align=False)
-        left, right = split.column(align=False), split.column(align=False)
-        split = left.column(align=False).split(factor=0.98, align=False)
-        left, _ = split.column(align=False), split.column(align=False)
+        grid = sub.grid_flow(row_major=True, columns=2, even_columns=False, align=False)
+        left, right = grid.column(align=False), grid.column(align=False)
         row = left.row(align=True)
-        row.enabled = not is_emulation_active or prefs.preferred_target_layout == 'QWERTY'
+        row.enabled = not is_emulation_active or target_layout_name == 'QWERTY'
         row.prop(prefs, "allow_non_qwerty_target_layouts")
-        split = left.row().split(factor=0.35, align=False)
-        left_l, left_r = split.row(align=False), split.row(align=False)
-        left_l.prop(prefs, "show_warning_banner", text="Warning button")
-        left_r.enabled = prefs.show_warning_banner
-        split = left_r.split(factor=0.4, align=False)
-        left_r_l, left_r_r = split.row(align=False), split.row(align=False)
-        left_r_l.prop(prefs, "large_warning_button_height", text="Size")
-        left_r_r.prop(prefs, "large_warning_button_style", expand=True)
-        split = left.row(align=True).split(factor=0.35, align=False)
-        left_l, left_r = split.row(align=True), split.row(align=True)
-        left_l.prop(prefs, "logging_enabled", text="Logging")
-        left_r.enabled = prefs.logging_enabled
-        left_r.prop(prefs, "logging_level", expand=True)
-
-        split = right.row().split(factor=0.65, align=True)
-        right_l, right_r = split.column(align=True), split.column(align=True)
-        right_l.prop(prefs, "reapply_on_keymaps_panel", text="Reapply automatically here")
-        right_r.enabled = prefs.reapply_on_keymaps_panel
-        right_r.prop(prefs, "reapply_on_keymaps_panel_delay", text="Delay")
-        split = right.row().split(factor=0.65, align=True)
-        right_l, right_r = split.column(align=True), split.column(align=True)
-        right_l.prop(prefs, "reapply_on_reload", text="Reapply emulation on restart")
-        right_r.enabled = prefs.reapply_on_reload
-        right_r.prop(prefs, "reapply_on_reload_delay", text="Delay")
-        split = right.row().split(factor=0.65, align=True)
-        right_l, right_r = split.column(align=True), split.column(align=True)
-        right_l.prop(prefs, "detect_addon_changes", text="Detect add-on installation")
-        right_r.enabled = prefs.detect_addon_changes
-        right_r.prop(prefs, "detect_addon_changes_polling_interval", text="Interval")
+        row = left.row(align=False)
+        row.prop(prefs, "show_warning_banner", text="Warning button")
+        sr = row.row(align=False)
+        sr.enabled = show_warning_banner
+        sr.prop(prefs, "large_warning_button_height", text="Size")
+        sr.prop(prefs, "large_warning_button_style", expand=True)
+        logging_enabled = prefs.logging_enabled
+        row = left.row(align=True)
+        row.prop(prefs, "logging_enabled", text="Logging")
+        sr = row.row(align=True)
+        sr.enabled = logging_enabled
+        sr.prop(prefs, "logging_level", expand=True)
+
+        for toggle, text, value, value_text in _DELAYED_PREFS:
+            row = right.row(align=True)
+            row.prop(prefs, toggle, text=text)
+            sr = row.row(align=True)
+            sr.enabled = getattr(prefs, toggle)
+            sr.prop(prefs, value, text=value_text)
 
 
     # Subpanel for editing the selected input keyboard layout
-    if ui_state.show_keyboard_layout_editor:
+    # Everything only needed by the editor is derived here, so it's skipped while collapsed
+    if show_editor:
+        is_built_in = is_built_in_layout(layout_name)
         is_layout_editable = not is_emulation_active and not is_built_in
         listening_key = ui_state.listening_key
 
@@ -237,98 +349,38 @@ def draw_in_keymap_prefs(self, context):
             display_rename_button = True
         left.label(text=msg, icon=icon)
         if display_rename_button:
-            op = left.operator(KLEOperators.rename_custom_layout, text="", icon='GREASEPENCIL', emboss=False)
+            op = left.operator(_OP_RENAME, text="", icon='GREASEPENCIL', emboss=False)
             op.layout = layout_name
             op.name = layout_name
 
         right.alignment = 'RIGHT'
         ir = right.row(align=True)
         # ir.enabled = is_layout_editable
-        op = ir.operator(KLEOperators.import_layout_json, text="Import layout...", icon='IMPORT')
+        op = ir.operator(_OP_IMPORT_LAYOUT, text="Import layout...", icon='IMPORT')
         op.layout_name = layout_name if is_layout_editable else ''
         op.filepath = f"{layout_name}.json"
         er = right.row(align=True)
-        op = er.operator(KLEOperators.export_layout_json, text="Export layout...", icon='EXPORT')
+        op = er.operator(_OP_EXPORT_LAYOUT, text="Export layout...", icon='EXPORT')
         op.layout = layout_name
         op.filepath = f"{layout_name}.json"
 
-        # Load conflicting keys from input keyboard layout
+        # Load conflicting keys from input keyboard layout (immutable, no need to copy them)
         conflicting_keys = input_layout_mapping.conflicting_keys()
-        conflicting_keys = set(conflicting_keys) if conflicting_keys else set()
+        has_conflicts = bool(conflicting_keys)
+        # Mapped directly, rather than through `map_input_to_output` for each key
+        in_out = input_layout_mapping.in_out_mapping
 
-        # Draw each display row with optimized recursive splitting
-        for keys in KEYBOARD_EDITOR_LAYOUT:
+        # Draw each display row with its precomputed splits, so keys are proportional to their widths
+        for tree in _KEYBOARD_EDITOR_ROWS:
             r = sub.row(align=True)
             if not is_layout_editable:
                 r.enabled = False
+            if tree is not None:
+                _draw_keys(r, tree, in_out, conflicting_keys, has_conflicts, layout_name, listening_key)
 
-            # Precompute cumulative weights for efficient drawing
-            cumulative_weights = [0.0]
-            running_sum = 0.0
-            for k in keys:
-                w = k.get('w', 1.0)
-                running_sum += w
-                cumulative_weights.append(running_sum)
-
-            total_weight = cumulative_weights[-1] if cumulative_weights else 0.0
-
-            # Recursive function to draw keys with minimal splits
-            def draw_keys_recursive(
-                    parent_layout, start_idx: int, end_idx: int, start_weight: float, end_weight: float):
-                if start_idx >= end_idx:
-                    return
-
-                if end_idx - start_idx == 1:
-                    # Draw single key
-                    k = keys[start_idx]
-                    if isinstance(k, dict):
-                        if 'ch' in k:
-                            qw_ch = str(k.get("ch", ""))
-                            if qw_ch:
-                                is_listening = ui_state.listening_key == qw_ch
-                                ch = input_layout_mapping.map_input_to_output(qw_ch)
-                                label = '...' if is_listening else ch
-                                red = ch in conflicting_keys and not is_listening
-                                if red:
-                                    parent_layout.alert = True
-                                    # label = f'[{label}]'
-                                op = parent_layout.operator(
-                                    KLEOperators.capture_key_for_mapping,
-                                    text=label,
-                                    depress=is_listening,
-                                )
-                                op.physical = qw_ch
-                                op.layout = layout_name
-                        else:
-                            # Non-editable key: render grayed-out button for context
-                            parent_layout.enabled = False
-                            label = str(k.get("label", ""))
-                            parent_layout.operator(KLEOperators.Info.non_editable_key, text=label)
-                else:
-                    # Split in half
-                    split_idx = (start_idx + end_idx) // 2
-                    range_weight = end_weight - start_weight
-                    split_weight = cumulative_weights[split_idx]
-
-                    left_weight = split_weight - start_weight
-                    factor = left_weight / range_weight
-
-                    # Create split with the correct factor
-                    split_layout = parent_layout.split(factor=factor)  # align=True
-                    left_row = split_layout.row(align=True)
-                    right_row = split_layout.row(align=True)
-
-                    # Recursively draw each half
-                    draw_keys_recursive(left_row, start_idx, split_idx, start_weight, split_weight)
-                    draw_keys_recursive(right_row, split_idx, end_idx, split_weight, end_weight)
-
-            # Start recursive drawing
-            if keys:
-                draw_keys_recursive(r, 0, len(keys), 0.0, total_weight)
-
-        if conflicting_keys:
+        if has_conflicts:
             row = sub.row()
-            if not prefs.allow_key_conflicts_in_input_layout:
+            if not allow_key_conflicts:
                 row.alert = True
             split = row.split(factor=0.65, align=False)
             left, right = split.row(align=True), split.row(align=True)
@@ -336,16 +388,17 @@ def draw_in_keymap_prefs(self, context):
             right.alignment = 'RIGHT'
             right.prop(prefs, "allow_key_conflicts_in_input_layout", text="Allow conflicts")
 
-    if prefs.is_emulation_active and prefs.show_warning_banner:
+    if is_emulation_active and show_warning_banner:
+        large_warning_button_style = prefs.large_warning_button_style
         row = ui_layout.row(align=True)
         row.scale_y = prefs.large_warning_button_height
         button_row = row.row(align=True)
-        if prefs.large_warning_button_style == 'RED':
+        if large_warning_button_style == 'RED':
             button_row.alert = True
         button_row.operator(
-            KLEOperators.revert_layout_emulation,
+            _OP_REVERT,
             text="Keyboard layout emulation is active. Consider reverting it before editing keymaps.",
-            icon='ERROR', depress=prefs.large_warning_button_style == 'BLUE',
+            icon='ERROR', depress=large_warning_button_style == 'BLUE',
         ).request_confirmation = True
         row.prop(
             prefs, 'show_warning_banner',
@@ -355,8 +408,8 @@ def draw_in_keymap_prefs(self, context):
         )
 
 # State variables for deferred add-on list polling
-_last_addons_prefs_draw_time = 0.0
-_last_addons_prefs_poll_time = 0.0
+# Whether the add-ons panel was drawn since the last scheduled poll
+_draw_since_last_poll = False
 _last_active_addons_set = set()
 _addon_check_scheduled = False
 
@@ -379,7 +432,7 @@ def draw_in_extensions_prefs(self, context):
     on_addon_menu_draw_call(context)
 
 def on_addon_menu_draw_call(context):
-    global _addon_check_scheduled, _last_addons_prefs_draw_time, _last_addons_prefs_poll_time
+    global _addon_check_scheduled, _draw_since_last_poll
 
     prefs = kle_prefs(context)
     logger = prefs.logger
@@ -392,47 +445,69 @@ def on_addon_menu_draw_call(context):
 
     poll_interval = prefs.detect_addon_changes_polling_interval
     if poll_interval <= 0:
-        addon_changes_poll()
+        addon_changes_poll(context)
     else:
-        _last_addons_prefs_draw_time = time.time()
         if not _addon_check_scheduled:
             _addon_check_scheduled = True
-            _last_addons_prefs_poll_time = _last_addons_prefs_draw_time
+            _draw_since_last_poll = False
             bpy.app.timers.register(scheduled_addon_changes_poll, first_interval=poll_interval)
+        else:
+            _draw_since_last_poll = True
 
 def scheduled_addon_changes_poll():
-    global _addon_check_scheduled, _last_addons_prefs_draw_time, _last_addons_prefs_poll_time
+    """
+    Timer polling for add-on changes, which keeps running while the add-ons panel is being drawn.
+    Returns the interval until the next poll, or `None` to stop.
+    """
+    global _addon_check_scheduled, _draw_since_last_poll
+    # Whether the timer keeps running, otherwise a later draw must be able to schedule it again,
+    # even if the poll below fails (in which case Blender unregisters the timer)
+    rescheduled = False
     try:
         # logger = kle_logger()
         # if logger:
-        #    logger.debug(f"... scheduled poll: {_last_addons_prefs_poll_time} [{_last_addons_prefs_draw_time}]")
-        if _last_addons_prefs_poll_time < _last_addons_prefs_draw_time:
+        #    logger.debug(f"... scheduled poll: {_draw_since_last_poll}")
+        next_interval = None
+        if _draw_since_last_poll:
+            _draw_since_last_poll = False
             prefs = kle_prefs()
-            # Re-register timer
-            bpy.app.timers.register(scheduled_addon_changes_poll, first_interval=prefs.detect_addon_changes_polling_interval)
-            _last_addons_prefs_poll_time = time.time()
+            # Keep the timer running
+            next_interval = prefs.detect_addon_changes_polling_interval
             # if logger:
             #     logger.debug(f"    re-registered")
-        else:
-            _addon_check_scheduled = False
-            # if logger:
-            #     logger.debug(f"    last")
-        addon_changes_poll()
+        # else:
+        #     if logger:
+        #         logger.debug(f"    last")
+        # Preferences are available from the timer's context, no need to override it
+        addon_changes_poll(bpy.context)
+        rescheduled = next_interval is not None
+        return next_interval
     except KLEPreferencesUnavailableException:
         # Handler triggered after add-on was uninstalled, skip
         # # kle_logger().debug("! Skipped add-on changes poll, add-on preferences unavailable. Add-on was likely disabled/uninstalled.")
         # If the preferences are not available, the logger is neither
         # print("! Skipped add-on changes poll, add-on preferences unavailable. Add-on was likely disabled/uninstalled.")
-        return
+        return None
+    finally:
+        if not rescheduled:
+            _addon_check_scheduled = False
 
 def get_current_set_of_addons(context=...) -> set[str]:
     if context is ...:
         context = bpy.context
     return {addon.module for addon in context.preferences.addons}
 
-def addon_changes_poll():
+def addon_changes_poll(context=...):
     global _last_active_addons_set
-    current_addons = get_current_set_of_addons()
+    if context is ...:
+        context = bpy.context
+    # Skip building the set of add-ons if it hasn't changed, which is the common case.
+    # Add-on modules are unique, so the same size and no unknown module means the same set.
+    addons = context.preferences.addons
+    if (_last_active_addons_set and len(addons) == len(_last_active_addons_set)
+            and all(addon.module in _last_active_addons_set for addon in addons)):
+        return
+    current_addons = get_current_set_of_addons(context)
     # logger = kle_logger()
     # if logger:
     #     logger.debug(f"... ! poll")
@@ -446,8 +521,7 @@ def addon_changes_poll():
         _last_active_addons_set = current_addons
         # if logger:
         #     logger.debug(f"    active addons changed, re-running event handlers")
-        from .event_handlers import on_addons_set_change
-        on_addons_set_change()
+        _event_handlers().on_addons_set_change()
     else:
         # if logger:
         #     logger.debug(f"    no change")
@@ -455,46 +529,64 @@ def addon_changes_poll():
 
 
 _addons_draw_hook_installed = False
+# Guard against re-entering the update while it installs or removes the draw hooks
+_in_hook_update = False
 def on_detect_addons_changes_update(context=...):
-    global _addons_draw_hook_installed
-    prefs = kle_prefs(context)
-    if prefs.detect_addon_changes != _addons_draw_hook_installed:
-        if _addons_draw_hook_installed:
-            remove_addons_menu_draw_hooks()
-            _addons_draw_hook_installed = False
-        else:
+    global _in_hook_update
+    if _in_hook_update:
+        return
+    _in_hook_update = True
+    try:
+        prefs = kle_prefs(context)
+        if bool(prefs.detect_addon_changes):
             append_addons_menu_draw_hooks()
-            _addons_draw_hook_installed = True
+        else:
+            remove_addons_menu_draw_hooks()
+    finally:
+        _in_hook_update = False
 
 
 def append_addons_menu_draw_hooks():
+    """Install the add-ons panel draw hooks, unless already installed."""
+    global _addons_draw_hook_installed
+    if _addons_draw_hook_installed:
+        return
     bpy.types.USERPREF_PT_addons.prepend(draw_in_addons_prefs)
     bpy.types.USERPREF_PT_extensions.prepend(draw_in_extensions_prefs)
+    _addons_draw_hook_installed = True
     # logger = kle_logger()
     # if logger:
     #     logger.debug(f"! Installed addons draw hook")
 
 def remove_addons_menu_draw_hooks():
+    """Remove the add-ons panel draw hooks, if installed."""
+    global _addons_draw_hook_installed
+    if not _addons_draw_hook_installed:
+        return
     bpy.types.USERPREF_PT_addons.remove(draw_in_addons_prefs)
     bpy.types.USERPREF_PT_extensions.remove(draw_in_extensions_prefs)
+    _addons_draw_hook_installed = False
     # logger = kle_logger()
     # if logger:
     #     logger.debug(f"! Removed addons draw hook")
 
 
 def register():
-    global _addons_draw_hook_installed
-
     bpy.types.USERPREF_PT_keymap.prepend(draw_in_keymap_prefs)
 
     # Deferred registration to ensure preferences are loaded
     bpy.app.timers.register(on_detect_addons_changes_update, first_interval=1)
 
 def unregister():
-    global _addons_draw_hook_installed
+    global _addon_check_scheduled, _reapply_timer
 
     bpy.types.USERPREF_PT_keymap.remove(draw_in_keymap_prefs)
 
-    if _addons_draw_hook_installed:
-        remove_addons_menu_draw_hooks()
-        _addons_draw_hook_installed = False
+    remove_addons_menu_draw_hooks()
+
+    if bpy.app.timers.is_registered(scheduled_addon_changes_poll):
+        bpy.app.timers.unregister(scheduled_addon_changes_poll)
+    _addon_check_scheduled = False
+    if _reapply_timer is not None and bpy.app.timers.is_registered(_reapply_timer):
+        bpy.app.timers.unregister(_reapply_timer)
+    _reapply_timer = None